@@ -152,6 +152,51 @@ handle_test_result() {
     fi
 }
 
+# Extract results of tests carrying a pytest marker from the combined run's junit.xml,
+# where test_template.py tags every test case with its markers
+extract_marked_results() {
+    local marker="$1"
+    local junit_xml="$2"
+    
+    python3 -c "
+import sys
+import xml.etree.ElementTree as ET
+
+marker, junit_xml = sys.argv[1], sys.argv[2]
+counts = {'PASSED': 0, 'FAILED': 0, 'SKIPPED': 0}
+try:
+    cases = list(ET.parse(junit_xml).getroot().iter('testcase'))
+except (OSError, ET.ParseError):
+    cases = []
+
+for case in cases:
+    markers = set()
+    for prop in case.iter('property'):
+        if prop.get('name') == 'markers':
+            markers.update(prop.get('value', '').split(','))
+    if marker not in markers:
+        continue
+
+    # Failures and setup/teardown errors keep their traceback in the report
+    problem = case.find('failure')
+    if problem is None:
+        problem = case.find('error')
+    if problem is not None:
+        status = 'FAILED'
+    elif case.find('skipped') is not None:
+        status = 'SKIPPED'
+    else:
+        status = 'PASSED'
+    counts[status] += 1
+    print(case.get('classname', '') + '::' + case.get('name', '') + ' ' + status)
+    if problem is not None:
+        print(problem.text or problem.get('message', ''))
+        print()
+
+print(marker + ': %d passed, %d failed, %d skipped' % (counts['PASSED'], counts['FAILED'], counts['SKIPPED']))
+" "$marker" "$junit_xml" || echo "${marker}: 0 passed, 0 failed, 0 skipped"
+}
+
 # Enhanced performance metrics collection
 collect_performance_metrics() {
     local contract_name="$1"
@@ -183,7 +228,7 @@ try:
     module_name = os.environ.get('CONTRACT_MODULE', 'contract')
     mod = importlib.import_module(module_name)
     if not hasattr(mod, 'approval_program'):
-        raise AttributeError(f"approval_program not found in module '{module_name}'")
+        raise AttributeError(f'approval_program not found in module {module_name!r}')
     from pyteal import compileTeal, Mode
     import json
     import time
@@ -192,19 +237,29 @@ try:
     teal = compileTeal(mod.approval_program(), mode=Mode.Application, version=6)
     compile_time = time.time() - start_time
 
+    # One pass over the TEAL for every tracked opcode instead of a str.count per opcode
+    import re
+    from collections import Counter
+    lines = teal.split('\\n')
+    op_counts = Counter(re.findall(
+        'app_global_get|app_local_get|app_global_put|app_local_put|bnz|bz|switch|itxn_begin'
+        '|asset_holding_get|asset_params_get|box_get|box_put|box_del',
+        teal
+    ))
+
     metrics = {
-        'teal_size': len(teal.split('\\n')),
-        'opcode_count': len([l for l in teal.split('\\n') if l and not l.startswith(('#', '//'))]),
+        'teal_size': len(lines),
+        'opcode_count': sum(1 for l in lines if l and not l.startswith(('#', '//'))),
         'compilation_time': compile_time,
         'state_ops': {
-            'global_get': teal.count('app_global_get'),
-            'local_get': teal.count('app_local_get'),
-            'global_put': teal.count('app_global_put'),
-            'local_put': teal.count('app_local_put')
+            'global_get': op_counts['app_global_get'],
+            'local_get': op_counts['app_local_get'],
+            'global_put': op_counts['app_global_put'],
+            'local_put': op_counts['app_local_put']
         },
         'branching': {
-            'if_statements': teal.count('bz') + teal.count('bnz'),
-            'switches': teal.count('switch')
+            'if_statements': op_counts['bz'] + op_counts['bnz'],
+            'switches': op_counts['switch']
         },
         'timestamp': '$(date '+%Y-%m-%d %H:%M:%S')',
         'contract': '$contract_name'
@@ -212,10 +267,10 @@ try:
 
     # Additional analysis for contract complexity
     metrics['complexity'] = {
-        'scratch_vars': len([l for l in teal.split('\\n') if 'store' in l.lower()]),
-        'inner_transactions': teal.count('itxn_begin'),
-        'asset_operations': sum(teal.count(op) for op in ['asset_holding_get', 'asset_params_get']),
-        'box_operations': sum(teal.count(op) for op in ['box_get', 'box_put', 'box_del']),
+        'scratch_vars': sum(1 for l in lines if 'store' in l.lower()),
+        'inner_transactions': op_counts['itxn_begin'],
+        'asset_operations': op_counts['asset_holding_get'] + op_counts['asset_params_get'],
+        'box_operations': op_counts['box_get'] + op_counts['box_put'] + op_counts['box_del'],
     }
 
     # Check for potential optimizations
@@ -291,13 +346,37 @@ run_comprehensive_tests() {
     local test_results_dir="/app/logs/reports/${contract_name}"
     mkdir -p "$test_results_dir"
     
-    # Unit Tests with enhanced reporting
-    log_with_timestamp "🧪 Running unit tests..." "debug"
+    # Unit, integration and performance tests share a single pytest run so that
+    # collection, plugin setup and contract loading happen once per contract
+    log_with_timestamp "🧪 Running unit, integration and performance tests..." "debug"
+    
+    # Coverage can be turned off with COLLECT_COVERAGE=0; performance tests
+    # are never traced (no_cover marker) so their measurements stay unskewed
+    local coverage_args=()
+    if [ "${COLLECT_COVERAGE:-1}" = "1" ]; then
+        coverage_args=(
+            -p pytest_cov.plugin
+            --cov="src"
+            --cov-config=/app/config/.coveragerc
+            --cov-report=term
+            --cov-report=xml:"$test_results_dir/coverage.xml"
+            --cov-report=html:"$test_results_dir/coverage-html"
+        )
+    fi
+    
+    # Plugin autoloading is disabled so pytest skips the entry-point scan of every
+    # installed plugin; pytest-timeout (--timeout) and xdist (PYTEST_ADDOPTS -n)
+    # are loaded explicitly, pytest-cov only when coverage is collected
+    # Integration/performance results are split out of this run's junit.xml; drop a
+    # stale one so a run that dies before writing it reports nothing
+    rm -f "$test_results_dir/junit.xml"
     cd "$contracts_dir"
-    if python -m pytest -c /app/config/pytest.ini --cov="src" \
-             --cov-report=term \
-             --cov-report=xml:"$test_results_dir/coverage.xml" \
-             --cov-report=html:"$test_results_dir/coverage-html" \
+    if PYTEST_DISABLE_PLUGIN_AUTOLOAD=1 python -m pytest -c /app/config/pytest.ini \
+             -p pytest_timeout \
+             -p xdist.plugin \
+             -p no:stepwise \
+             -m "unit or integration or performance" \
+             "${coverage_args[@]}" \
              --junitxml="$test_results_dir/junit.xml" \
              --timeout=30 \
              --tb=short \
@@ -316,25 +395,12 @@ run_comprehensive_tests() {
     fi
     cd /app
     
-    # Integration Tests with timeout and retry
-    log_with_timestamp "🔄 Running integration tests..." "integration"
-    cd "$contracts_dir"
-    CONTRACT_NAME="$contract_name" python -m pytest -c /app/config/pytest.ini -m integration \
-             --junitxml="$test_results_dir/integration.xml" \
-             --tb=short \
-             tests/ 2>&1 | tee "$test_results_dir/integration.log" || \
-        log_with_timestamp "⚠️ Integration tests completed with issues" "warning"
-    cd /app
-    
-    # Performance Tests with metrics
-    log_with_timestamp "⚡ Running performance tests..." "performance"
-    cd "$contracts_dir"
-    CONTRACT_NAME="$contract_name" python -m pytest -c /app/config/pytest.ini -m performance \
-             --junitxml="$test_results_dir/performance.xml" \
-             --tb=short \
-             tests/ 2>&1 | tee "$test_results_dir/performance.log" || \
-        log_with_timestamp "⚠️ Performance tests completed with issues" "warning"
-    cd /app
+    # Integration and performance results (with failure tracebacks) are split out
+    # of the combined run's junit.xml by the markers test_template.py records
+    extract_marked_results integration "$test_results_dir/junit.xml" > "$test_results_dir/integration.log"
+    log_with_timestamp "🔄 Integration tests: $(tail -n1 "$test_results_dir/integration.log")" "integration"
+    extract_marked_results performance "$test_results_dir/junit.xml" > "$test_results_dir/performance.log"
+    log_with_timestamp "⚡ Performance tests: $(tail -n1 "$test_results_dir/performance.log")" "performance"
     
     # Collect detailed performance metrics
     collect_performance_metrics "$contract_name" "$contracts_dir"
@@ -342,45 +408,57 @@ run_comprehensive_tests() {
     # Security Analysis with enhanced reporting
     log_with_timestamp "🛡️ Running comprehensive security analysis..." "security"
     
+    # Bandit, MyPy and Flake8 only read the contract sources, so they run
+    # concurrently and are collected once all three have finished
+    
     # Bandit security scan with configuration
     log_with_timestamp "🔍 Running Bandit security scan..." "security"
-    if bandit -r "$contracts_dir/src/" \
+    bandit -r "$contracts_dir/src/" \
            -f txt \
            -o "$test_results_dir/bandit.log" \
            --confidence-level low \
-           --severity-level low 2>&1; then
-        log_with_timestamp "✅ Bandit scan completed" "success"
-    else
-        log_with_timestamp "⚠️ Bandit security scan completed with issues" "warning"
-        # Ensure we have some output even if bandit fails
-        echo "Bandit scan attempted but failed or found issues" >> "$test_results_dir/bandit.log"
-    fi
+           --severity-level low 2>&1 &
+    local bandit_pid=$!
     
     # Static Analysis with detailed reporting
     log_with_timestamp "🔍 Running static analysis..." "debug"
     
     # MyPy type checking with strict mode
     log_with_timestamp "🔍 Running MyPy type checking..." "debug"
-    if mypy "$contracts_dir/src/" \
+    mypy "$contracts_dir/src/" \
          --show-error-codes \
          --show-error-context \
          --pretty \
          --ignore-missing-imports \
-         > "$test_results_dir/mypy.log" 2>&1; then
-        log_with_timestamp "✅ MyPy type checking completed" "success"
-    else
-        log_with_timestamp "⚠️ MyPy type checking completed with issues" "warning"
-        echo "MyPy analysis attempted" >> "$test_results_dir/mypy.log"
-    fi
+         > "$test_results_dir/mypy.log" 2>&1 &
+    local mypy_pid=$!
     
     # Flake8 style checking with detailed configuration
     log_with_timestamp "🔍 Running Flake8 style checking..." "debug"
-    if flake8 "$contracts_dir/src/" \
+    flake8 "$contracts_dir/src/" \
            --max-line-length=88 \
            --extend-ignore=E203 \
            --statistics \
            --show-source \
-           > "$test_results_dir/flake8.log" 2>&1; then
+           > "$test_results_dir/flake8.log" 2>&1 &
+    local flake8_pid=$!
+    
+    if wait "$bandit_pid"; then
+        log_with_timestamp "✅ Bandit scan completed" "success"
+    else
+        log_with_timestamp "⚠️ Bandit security scan completed with issues" "warning"
+        # Ensure we have some output even if bandit fails
+        echo "Bandit scan attempted but failed or found issues" >> "$test_results_dir/bandit.log"
+    fi
+    
+    if wait "$mypy_pid"; then
+        log_with_timestamp "✅ MyPy type checking completed" "success"
+    else
+        log_with_timestamp "⚠️ MyPy type checking completed with issues" "warning"
+        echo "MyPy analysis attempted" >> "$test_results_dir/mypy.log"
+    fi
+    
+    if wait "$flake8_pid"; then
         log_with_timestamp "✅ Flake8 style checking completed" "success"
     else
         log_with_timestamp "⚠️ Flake8 style checking completed with issues" "warning"
@@ -405,30 +483,64 @@ run_comprehensive_tests() {
     if python3 -c "
 import sys, types, os, importlib
 sys.path.append('src')
-# Compatibility shim: map algosdk.future.transaction to algosdk.transaction if needed
-try:
-    import algosdk  # noqa: F401
+
+def install_algosdk_shim():
+    # Compatibility shim: map algosdk.future.transaction to algosdk.transaction if needed
     try:
-        import algosdk.future  # noqa: F401
-    except Exception:
+        import algosdk  # noqa: F401
         try:
-            import algosdk.transaction as _txn_mod  # noqa: F401
-            _future_mod = types.ModuleType('algosdk.future')
-            _future_mod.transaction = _txn_mod
-            sys.modules.setdefault('algosdk.future', _future_mod)
-            sys.modules.setdefault('algosdk.future.transaction', _txn_mod)
+            import algosdk.future  # noqa: F401
         except Exception:
-            pass
-except Exception:
-    pass
+            try:
+                import algosdk.transaction as _txn_mod  # noqa: F401
+                _future_mod = types.ModuleType('algosdk.future')
+                _future_mod.transaction = _txn_mod
+                sys.modules.setdefault('algosdk.future', _future_mod)
+                sys.modules.setdefault('algosdk.future.transaction', _txn_mod)
+            except Exception:
+                pass
+    except Exception:
+        pass
+
 try:
+    import hashlib
     module_name = os.environ.get('CONTRACT_MODULE', 'contract')
-    contract = importlib.import_module(module_name)
-    from pyteal import compileTeal, Mode
-    
-    # Try to compile approval program
-    if hasattr(contract, 'approval_program'):
-        approval_teal = compileTeal(contract.approval_program(), mode=Mode.Application, version=6)
+    source_path = os.path.join('src', module_name + '.py')
+    teal_cache_dir = os.environ.get('TEAL_CACHE_DIR', '/tmp/teal-cache')
+
+    try:
+        import importlib.metadata
+        pyteal_version = importlib.metadata.version('pyteal')
+    except Exception:
+        pyteal_version = None
+
+    def cached_teal(which):
+        # TEAL written by the test suite (see test_template.py), keyed by source hash and PyTeal version
+        if pyteal_version is None or not os.path.exists(source_path):
+            return None
+        with open(source_path, 'rb') as f:
+            digest = hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+        cache_path = os.path.join(teal_cache_dir, f'{digest}-{which}-v6-pyteal{pyteal_version}.teal')
+        if os.path.exists(cache_path):
+            with open(cache_path) as f:
+                return f.read()
+        return None
+
+    approval_teal = cached_teal('approval')
+    clear_teal = cached_teal('clear')
+
+    # Importing the contract pulls in PyTeal and algosdk; only pay for it when the cache is cold
+    if approval_teal is None or clear_teal is None:
+        install_algosdk_shim()
+        contract = importlib.import_module(module_name)
+        from pyteal import compileTeal, Mode
+        if approval_teal is None and hasattr(contract, 'approval_program'):
+            approval_teal = compileTeal(contract.approval_program(), mode=Mode.Application, version=6)
+        if clear_teal is None and hasattr(contract, 'clear_state_program'):
+            clear_teal = compileTeal(contract.clear_state_program(), mode=Mode.Application, version=6)
+    
+    # Report approval program
+    if approval_teal is not None:
         print('=== APPROVAL PROGRAM ===')
         print(approval_teal)
         
@@ -437,9 +549,8 @@ try:
         print(f'\n=== METRICS ===')
         print(f'Approval Program Opcodes: {opcodes}')
     
-    # Try to compile clear state program
-    if hasattr(contract, 'clear_state_program'):
-        clear_teal = compileTeal(contract.clear_state_program(), mode=Mode.Application, version=6)
+    # Report clear state program
+    if clear_teal is not None:
         print('\n=== CLEAR STATE PROGRAM ===')
         print(clear_teal)
     
@@ -3,11 +3,27 @@ from pyteal import compileTeal, Mode
 from algosdk import transaction, account
 from algosdk.v2client import algod
 import time
+import functools
+from dataclasses import dataclass
+import hashlib
+import importlib.metadata
 import importlib.util
 import os
+import re
 import sys
 import types
 
+TEAL_VERSION = 6
+# Shared with the TEAL analysis step in entrypoint.sh, which runs in a separate process
+TEAL_CACHE_DIR = os.environ.get('TEAL_CACHE_DIR', '/tmp/teal-cache')
+# Part of the cache key: the same source compiles differently across PyTeal releases
+try:
+    PYTEAL_VERSION = importlib.metadata.version('pyteal')
+except importlib.metadata.PackageNotFoundError:
+    PYTEAL_VERSION = None
+# app_global_get, app_local_get, app_global_put, app_local_put
+_STATE_RE = re.compile(r"app_(?:global|local)_(?:get|put)")
+
 # Compatibility shim: support older contracts importing algosdk.future.transaction
 try:
     import algosdk  # noqa: F401
@@ -26,6 +42,45 @@ try:
 except Exception:
     pass
 
+# Contract modules loaded by import_contract, keyed by id() for _compiled
+_MODULES = {}
+# Executed contract modules keyed by (path, mtime) so repeated imports are free
+_MOD_CACHE = {}
+
+def _teal_cache_path(module, which, version):
+    """Location of the compiled TEAL handed to the TEAL analysis step, keyed by a
+    hash of the contract source and the PyTeal version."""
+    source_path = getattr(module, '__file__', None)
+    if not source_path or PYTEAL_VERSION is None:
+        return None
+    with open(source_path, 'rb') as f:
+        digest = hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+    return os.path.join(TEAL_CACHE_DIR, f"{digest}-{which}-v{version}-pyteal{PYTEAL_VERSION}.teal")
+
+@functools.lru_cache(maxsize=32)
+def _compiled(module_id, which, version=TEAL_VERSION):
+    """Compile the approval or clear state program of a loaded contract once.
+    Results are memoized in-process only, so every test session really compiles
+    (and traces) the contract; the TEAL is also written under TEAL_CACHE_DIR, if
+    not already there, for the TEAL analysis step, which reads it instead of
+    recompiling.
+    """
+    module = _MODULES[module_id]
+    program = module.approval_program() if which == 'approval' else module.clear_state_program()
+    teal = compileTeal(program, mode=Mode.Application, version=version)
+    cache_path = _teal_cache_path(module, which, version)
+    # The entry is content-addressed, so an existing file already holds this TEAL
+    if cache_path and not os.path.exists(cache_path):
+        try:
+            os.makedirs(TEAL_CACHE_DIR, exist_ok=True)
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w') as f:
+                f.write(teal)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass
+    return teal
+
 def import_contract(contract_name):
     """Dynamically import the uploaded contract module by its original filename.
     Falls back to 'contract.py' for backward compatibility. Skips on SyntaxError/import errors.
@@ -33,18 +88,49 @@ def import_contract(contract_name):
     module_basename = os.environ.get('CONTRACT_MODULE') or 'contract'
     contract_path = f"/app/contracts/{contract_name}/src/{module_basename}.py"
     try:
+        cache_key = (contract_path, os.path.getmtime(contract_path))
+        if cache_key in _MOD_CACHE:
+            return _MOD_CACHE[cache_key]
         spec = importlib.util.spec_from_file_location(module_basename, contract_path)
         module = importlib.util.module_from_spec(spec)
         assert spec.loader is not None
         spec.loader.exec_module(module)
+        # Expose under its own name without shadowing an already-imported module
+        sys.modules.setdefault(module_basename, module)
+        _MOD_CACHE[cache_key] = module
+        _MODULES[id(module)] = module
         return module
     except SyntaxError as e:
         pytest.skip(f"SyntaxError in contract module: {e}")
     except Exception as e:
         pytest.skip(f"Import error in contract module: {e}")
 
+@dataclass(slots=True)
+class ContractInfo:
+    """Contract module plus the attribute checks every test needs, resolved once"""
+    module: types.ModuleType
+    has_approval: bool
+    has_clear: bool
+
+    @property
+    def approval_teal(self):
+        return _compiled(id(self.module), 'approval')
+
+    @property
+    def clear_teal(self):
+        return _compiled(id(self.module), 'clear')
+
+@pytest.fixture(scope="session", autouse=True)
+def _record_markers(request):
+    """Tag every test in junit.xml with its markers so the entrypoint can split the
+    single run into integration/performance results. Session-scoped so it runs before
+    contract_module, whose skip would otherwise leave the skipped tests untagged.
+    """
+    for item in request.session.items:
+        item.user_properties.append(("markers", ",".join(sorted({m.name for m in item.iter_markers()}))))
+
 class TestAlgorandContract:
-    @pytest.fixture(scope="class")
+    @pytest.fixture(scope="session")
     def contract_module(self):
         """Load the contract module dynamically"""
         contract_name = os.environ.get('CONTRACT_NAME')
@@ -52,7 +138,16 @@ class TestAlgorandContract:
             pytest.skip("No CONTRACT_NAME environment variable set")
         return import_contract(contract_name)
 
-    @pytest.fixture(scope="class")
+    @pytest.fixture(scope="session")
+    def contract_info(self, contract_module):
+        """Contract module with its program lookups cached for the session"""
+        return ContractInfo(
+            module=contract_module,
+            has_approval=hasattr(contract_module, 'approval_program'),
+            has_clear=hasattr(contract_module, 'clear_state_program'),
+        )
+
+    @pytest.fixture(scope="session")
     def algod_client(self):
         """Setup Algorand client"""
         algod_token = "aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa"
@@ -65,34 +160,28 @@ class TestAlgorandContract:
             pytest.skip("Algod devnet not reachable; skipping integration-dependent tests")
         return client
 
-    def test_approval_program_compilation(self, contract_module):
+    @pytest.mark.unit
+    def test_approval_program_compilation(self, contract_info):
         """Test if approval program compiles"""
-        if hasattr(contract_module, 'approval_program'):
-            teal = compileTeal(
-                contract_module.approval_program(),
-                mode=Mode.Application,
-                version=6
-            )
+        if contract_info.has_approval:
+            teal = contract_info.approval_teal
             assert teal and "#pragma version" in teal
         else:
             pytest.skip("No approval_program found in contract")
 
-    def test_clear_state_program_compilation(self, contract_module):
+    @pytest.mark.unit
+    def test_clear_state_program_compilation(self, contract_info):
         """Test if clear state program compiles"""
-        if hasattr(contract_module, 'clear_state_program'):
-            teal = compileTeal(
-                contract_module.clear_state_program(),
-                mode=Mode.Application,
-                version=6
-            )
+        if contract_info.has_clear:
+            teal = contract_info.clear_teal
             assert teal and "#pragma version" in teal
         else:
             pytest.skip("No clear_state_program found in contract")
 
     @pytest.mark.integration
-    def test_app_creation(self, contract_module, algod_client):
+    def test_app_creation(self, contract_info, algod_client):
         """Test application creation"""
-        if not hasattr(contract_module, 'approval_program'):
+        if not contract_info.has_approval:
             pytest.skip("No approval_program found in contract")
 
         creator_private_key, creator_address = account.generate_account()
@@ -102,16 +191,8 @@ class TestAlgorandContract:
             sender=creator_address,
             sp=sp,
             on_complete=transaction.OnComplete.NoOpOC,
-            approval_program=compileTeal(
-                contract_module.approval_program(),
-                mode=Mode.Application,
-                version=6
-            ),
-            clear_program=compileTeal(
-                contract_module.clear_state_program(),
-                mode=Mode.Application,
-                version=6
-            ),
+            approval_program=contract_info.approval_teal,
+            clear_program=contract_info.clear_teal,
             global_schema=transaction.StateSchema(num_uints=1, num_byte_slices=1),
             local_schema=transaction.StateSchema(num_uints=0, num_byte_slices=0)
         )
@@ -125,32 +206,24 @@ class TestAlgorandContract:
             pytest.skip(f"App creation requires funded account/devnet; skipping. Reason: {str(e)}")
 
     @pytest.mark.performance
-    def test_opcode_count(self, contract_module):
+    @pytest.mark.no_cover
+    def test_opcode_count(self, contract_info):
         """Test TEAL opcode count"""
-        if not hasattr(contract_module, 'approval_program'):
+        if not contract_info.has_approval:
             pytest.skip("No approval_program found in contract")
 
-        teal = compileTeal(
-            contract_module.approval_program(),
-            mode=Mode.Application,
-            version=6
-        )
-        opcode_count = len([line for line in teal.split('\n') 
-                           if line and not line.startswith(('#', '//'))])
+        teal = contract_info.approval_teal
+        opcode_count = sum(1 for line in teal.splitlines()
+                           if line and not line.startswith(('#', '//')))
         assert opcode_count < 1000, f"Too many opcodes: {opcode_count}"
 
     @pytest.mark.performance
-    def test_state_access_performance(self, contract_module):
+    @pytest.mark.no_cover
+    def test_state_access_performance(self, contract_info):
         """Test state access patterns"""
-        if not hasattr(contract_module, 'approval_program'):
+        if not contract_info.has_approval:
             pytest.skip("No approval_program found in contract")
 
-        teal = compileTeal(
-            contract_module.approval_program(),
-            mode=Mode.Application,
-            version=6
-        )
-        state_ops = ["app_global_get", "app_local_get", 
-                     "app_global_put", "app_local_put"]
-        access_count = sum(teal.count(op) for op in state_ops)
+        teal = contract_info.approval_teal
+        access_count = len(_STATE_RE.findall(teal))
         assert access_count < 30, f"Too many state accesses: {access_count}"
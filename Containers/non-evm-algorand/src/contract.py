@@ -15,29 +15,29 @@ def approval_program():
         PyTeal expression that always approves
     """
     
-    # Basic handle_creation
-    handle_creation = Return(Int(1))
+    # Router outcomes
+    approve = Return(Int(1))
+    reject = Return(Int(0))
     
-    # Basic handle_optin
-    handle_optin = Return(Int(1))
-    
-    # Basic handle_closeout
-    handle_closeout = Return(Int(1))
-    
-    # Basic handle_updateapp
-    handle_updateapp = Return(Int(0))
-    
-    # Basic handle_deleteapp
-    handle_deleteapp = Return(Int(0))
-    
-    # Main router for handling different transaction types
+    # Main router: creation, OptIn, CloseOut and NoOp are approved,
+    # UpdateApplication and DeleteApplication are rejected
     program = Cond(
-        [Txn.application_id() == Int(0), handle_creation],
-        [Txn.on_completion() == OnComplete.OptIn, handle_optin],
-        [Txn.on_completion() == OnComplete.CloseOut, handle_closeout],
-        [Txn.on_completion() == OnComplete.UpdateApplication, handle_updateapp],
-        [Txn.on_completion() == OnComplete.DeleteApplication, handle_deleteapp],
-        [Txn.on_completion() == OnComplete.NoOp, Return(Int(1))]
+        [
+            Or(
+                Txn.application_id() == Int(0),
+                Txn.on_completion() == OnComplete.OptIn,
+                Txn.on_completion() == OnComplete.CloseOut,
+                Txn.on_completion() == OnComplete.NoOp,
+            ),
+            approve,
+        ],
+        [
+            Or(
+                Txn.on_completion() == OnComplete.UpdateApplication,
+                Txn.on_completion() == OnComplete.DeleteApplication,
+            ),
+            reject,
+        ],
     )
     
     return program
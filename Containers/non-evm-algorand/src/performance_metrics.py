@@ -1,6 +1,16 @@
 from pyteal import *
+import importlib.util
+import os
 import time
 
+def _load_contract(contract_path: str):
+    """Import the contract module at contract_path"""
+    module_name = os.path.splitext(os.path.basename(contract_path))[0]
+    spec = importlib.util.spec_from_file_location(module_name, contract_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
 def measure_contract_performance(contract_path: str) -> dict:
     """Measure contract performance metrics"""
     metrics = {
@@ -11,20 +21,22 @@ def measure_contract_performance(contract_path: str) -> dict:
     }
     
     try:
-        with open(contract_path, 'r') as f:
-            content = f.read()
+        module = _load_contract(contract_path)
             
-        # Compile to TEAL
+        # Compile to TEAL, timing only the compilation itself
+        compile_start = time.time()
         teal = compileTeal(
-            approval_program(),
+            module.approval_program(),
             mode=Mode.Application,
             version=6
         )
+        compilation_time = time.time() - compile_start
         
+        lines = teal.splitlines()
         metrics.update({
-            "teal_size": len(teal.splitlines()),
-            "opcode_count": len([l for l in teal.splitlines() if not l.startswith(('#', '//'))]),
-            "compilation_time": time.time() - metrics["start_time"]
+            "teal_size": len(lines),
+            "opcode_count": sum(1 for l in lines if not l.startswith(('#', '//'))),
+            "compilation_time": compilation_time
         })
         
     except Exception as e:
@@ -2,64 +2,94 @@ import sys
 import re
 from pathlib import Path
 
-def parse_functions(contract_path):
-    src = Path(contract_path).read_text()
+# External and view function declarations (Cairo 0 syntax)
+_FUNC_PATTERN = re.compile(
+    r'@(external|view)[^\n]*\s*\n\s*func\s+(\w+)\(([^\)]*)\)(?:\s*->\s*\((.*?)\))?:'
+)
+
+def parse_functions(src):
+    # Cairo 1 sources and contracts without entry points have no decorators to match
+    if '@external' not in src and '@view' not in src:
+        return []
     # Find all external and view functions
-    func_pattern = r'@(external|view)[^\n]*\s*\n\s*func\s+(\w+)\(([^\)]*)\)(?:\s*->\s*\((.*?)\))?:'
-    matches = re.findall(func_pattern, src, re.MULTILINE)
-    return matches
+    out = []
+    for m in _FUNC_PATTERN.finditer(src):
+        out.append((m.group(1), m.group(2), m.group(3), m.group(4) or ''))
+    return out
 
-def gen_test_header(contract_name):
-    # Generate basic tests that can run without complex StarkNet dependencies
-    return f'''import pytest
+# Generated file preamble: imports plus contract-level sanity tests
+_HEADER_TEMPLATE = '''import pytest
 import os
+import re
 import sys
 from pathlib import Path
 
 # Basic tests for Cairo contract: {contract_name}
 
+CONTRACT_PATH = Path(__file__).parent.parent / "src" / "contract.cairo"
+
+@pytest.fixture(scope="session")
+def contract_src():
+    """Contract source, read once and shared by every test"""
+    return CONTRACT_PATH.read_text()
+
 def test_contract_file_exists():
     """Test that the contract file exists and is readable"""
-    contract_path = Path(__file__).parent.parent / "src" / "contract.cairo"
-    assert contract_path.exists(), f"Contract file not found: {{contract_path}}"
-    assert contract_path.is_file(), "Contract path is not a file"
+    assert CONTRACT_PATH.exists(), f"Contract file not found: {{CONTRACT_PATH}}"
+    assert CONTRACT_PATH.is_file(), "Contract path is not a file"
 
-def test_contract_not_empty():
+def test_contract_not_empty(contract_src):
     """Test that the contract file is not empty"""
-    contract_path = Path(__file__).parent.parent / "src" / "contract.cairo"
-    content = contract_path.read_text()
-    assert len(content.strip()) > 0, "Contract file is empty"
-    assert "func" in content or "contract" in content, "Contract file doesn't contain expected Cairo syntax"
+    assert len(contract_src.strip()) > 0, "Contract file is empty"
+    assert "func" in contract_src or "contract" in contract_src, "Contract file doesn't contain expected Cairo syntax"
 
-def test_contract_syntax_basic():
+def test_contract_syntax_basic(contract_src):
     """Basic syntax check for Cairo contract"""
-    contract_path = Path(__file__).parent.parent / "src" / "contract.cairo"
-    content = contract_path.read_text()
     # Check for basic Cairo patterns
-    assert not content.count("(") < content.count(")"), "Unmatched closing parentheses"
-    assert not content.count("{{") < content.count("}}"), "Unmatched closing braces"
+    assert not contract_src.count("(") < contract_src.count(")"), "Unmatched closing parentheses"
+    assert not contract_src.count("{{") < contract_src.count("}}"), "Unmatched closing braces"
 '''
 
-def gen_test_func(func_type, func_name, args, returns):
-    # Generate a simple test that checks if the function exists in the contract
-    test_fn = f'''
-def test_function_{func_name}_exists():
-    """Test that function {func_name} is defined in the contract"""
-    contract_path = Path(__file__).parent.parent / "src" / "contract.cairo"
-    content = contract_path.read_text()
-    assert "func {func_name}" in content, f"Function {func_name} not found in contract"
-    
-def test_function_{func_name}_signature():
-    """Test that function {func_name} has proper Cairo syntax"""
-    contract_path = Path(__file__).parent.parent / "src" / "contract.cairo"
-    content = contract_path.read_text()
+# Tests for every parsed function, parametrized over a single FUNCS table
+_FUNC_TESTS_TEMPLATE = r'''
+# (decorator, name) of every external and view function parsed from the contract
+FUNCS = [
+{entries}]
+
+# Signature patterns, compiled once when the tests import
+_SIG_PATTERNS = {{
+    fn: re.compile(r'@' + ft + r'\s*\n\s*func\s+' + fn + r'\s*\(')
+    for ft, fn in FUNCS
+}}
+
+@pytest.mark.parametrize("ft,fn", FUNCS, ids=[fn for _, fn in FUNCS])
+def test_function_exists(contract_src, ft, fn):
+    """Test that the function is defined in the contract"""
+    assert f"func {{fn}}" in contract_src, f"Function {{fn}} not found in contract"
+
+@pytest.mark.parametrize("ft,fn", FUNCS, ids=[fn for _, fn in FUNCS])
+def test_function_signature(contract_src, ft, fn):
+    """Test that the function has proper Cairo syntax"""
     # Look for the function definition
-    import re
-    pattern = r'@{func_type}\\s*\\n\\s*func\\s+{func_name}\\s*\\('
-    matches = re.search(pattern, content)
-    assert matches is not None, f"Function {func_name} with @{func_type} decorator not found"
+    matches = _SIG_PATTERNS[fn].search(contract_src)
+    assert matches is not None, f"Function {{fn}} with @{{ft}} decorator not found"
+'''
+_FUNC_ENTRY = '''    ("{func_type}", "{func_name}"),
 '''
-    return test_fn
+
+def gen_test_header(contract_name):
+    # Generate basic tests that can run without complex StarkNet dependencies
+    return _HEADER_TEMPLATE.format(contract_name=contract_name)
+
+def gen_function_tests(matches):
+    # Generate parametrized tests checking that each function exists in the contract
+    if not matches:
+        return ''
+    entries = ''.join(
+        _FUNC_ENTRY.format(func_type=func_type, func_name=func_name)
+        for func_type, func_name, _args, _returns in matches
+    )
+    return _FUNC_TESTS_TEMPLATE.format(entries=entries)
 
 if __name__ == '__main__':
     if len(sys.argv) != 3:
@@ -70,10 +100,8 @@ if __name__ == '__main__':
     output_path = sys.argv[2]
     contract_name = Path(contract_path).stem
 
-    matches = parse_functions(contract_path)
-    output = gen_test_header(contract_name)
-
-    for func_type, func_name, args, returns in matches:
-        output += gen_test_func(func_type, func_name, args, returns)
-
-    Path(output_path).write_text(output)
+    src = Path(contract_path).read_text()
+    matches = parse_functions(src)
+    with Path(output_path).open('w') as f:
+        f.write(gen_test_header(contract_name))
+        f.write(gen_function_tests(matches))
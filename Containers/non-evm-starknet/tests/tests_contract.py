@@ -1,5 +1,7 @@
 import pytest
-from starkware.starknet.testing.starknet import Starknet
+
+# Skip the whole module up front when the StarkNet toolchain is unavailable
+Starknet = pytest.importorskip("starkware.starknet.testing.starknet").Starknet
 
 @pytest.mark.asyncio
 async def test_deploy():